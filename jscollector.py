@@ -5,17 +5,22 @@ Passively collects Secrets & Paths/URLs from JavaScript files proxied through Bu
 Supports user-configurable custom regex patterns and categories.
 """
 
-from burp import IBurpExtender, IContextMenuFactory, ITab, IProxyListener
+from burp import IBurpExtender, IContextMenuFactory, ITab, IProxyListener, IExtensionStateListener
 
-from javax.swing import JMenuItem
+from javax.swing import JMenuItem, Timer
 from java.awt.event import ActionListener
-from java.util import ArrayList
+from java.lang import Runnable, Runtime, String
+from java.math import BigInteger
+from java.security import MessageDigest
+from java.util import ArrayList, Collections, LinkedHashMap
+from java.util.concurrent import ConcurrentLinkedQueue, ThreadPoolExecutor, ArrayBlockingQueue, TimeUnit
 from java.io import PrintWriter
 
 import sys
 import os
 import re
 import inspect
+import threading
 
 # Add extension directory to path
 try:
@@ -34,10 +39,51 @@ from ui.results_panel import ResultsPanel
 from pattern_manager import PatternManager
 
 
-class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
+# ==================== VALIDATION CONSTANTS ====================
+# Tuples for str.endswith(); word lists folded into one regex each so a
+# validator does a single search instead of one substring scan per word
+
+HTML_EXTS = ('.html', '.htm')
+
+STATIC_EXTS = ('.css', '.png', '.jpg', '.gif', '.svg', '.woff', '.ttf', '.ico')
+
+SECRET_NOISE_RE = re.compile('|'.join(map(re.escape, (
+    'example', 'placeholder', 'your', 'xxxx', 'test', 'sample', 'dummy',
+))), re.IGNORECASE)
+
+EMAIL_NOISE_DOMAINS = frozenset((
+    'example.com', 'test.com', 'domain.com', 'placeholder.com', 'email.com',
+))
+
+EMAIL_NOISE_RE = re.compile('|'.join(map(re.escape, (
+    'example', 'test', 'placeholder', 'noreply', 'no-reply',
+))), re.IGNORECASE)
+
+FILE_NOISE_RE = re.compile('|'.join(map(re.escape, (
+    'package.json', 'tsconfig.json', 'webpack', 'babel',
+    'eslint', 'prettier', 'node_modules', '.min.',
+    'polyfill', 'vendor', 'chunk', 'bundle', '.map',
+))))
+
+# Control bytes that don't occur in JS/HTML text (tab, LF, VT, FF and CR are allowed)
+BINARY_CHARS_RE = re.compile(r'[\x00-\x08\x0e-\x1f\x7f]')
+
+# An endpoint needs at least one path segment of two or more characters
+ENDPOINT_SEGMENT_RE = re.compile(r'[^/]{2}')
+
+
+class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener, IExtensionStateListener):
     """JSCollector - Passive JS analysis with custom pattern support."""
     
     EXTENSION_NAME = "JSCollector"
+    UI_DRAIN_INTERVAL_MS = 250
+    ANALYSIS_QUEUE_SIZE = 64
+    MAX_SCAN_BYTES = 2 * 1024 * 1024
+    MAX_FINDINGS = 100000  # per category; beyond this the oldest tenth is dropped at once
+    SCAN_WINDOW_BYTES = 256 * 1024
+    SEEN_BODIES_MAX = 1024
+    FINGERPRINT_BYTES = 64 * 1024
+    TEXT_SNIFF_BYTES = 4096
     
     def registerExtenderCallbacks(self, callbacks):
         self._callbacks = callbacks
@@ -48,26 +94,44 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         self._stdout = PrintWriter(callbacks.getStdout(), True)
         self._stderr = PrintWriter(callbacks.getStderr(), True)
         
+        # Fingerprints of recently scanned bodies - the same vendor JS is served over and over
+        self._seen_bodies = Collections.synchronizedMap(LruMap(self.SEEN_BODIES_MAX))
+        
+        # Results storage
+        self.all_findings = {}  # category -> list of findings, trimmed along with seen_values
+        self.seen_values = {}  # category -> insertion-ordered LruMap of values
+        self._findings_lock = threading.Lock()
+        
         # Initialize pattern manager
         self.pattern_manager = PatternManager()
+        self.invalidate_cache()
         
-        # Results storage
-        self.all_findings = []
-        self.seen_values = set()
+        # Passive analysis runs off the proxy thread; when the queue is full the oldest task is dropped
+        workers = max(2, Runtime.getRuntime().availableProcessors() - 1)
+        self._pool = ThreadPoolExecutor(
+            workers, workers, 60, TimeUnit.SECONDS,
+            ArrayBlockingQueue(self.ANALYSIS_QUEUE_SIZE),
+            ThreadPoolExecutor.DiscardOldestPolicy()
+        )
         
         # Initialize UI
         self.panel = ResultsPanel(callbacks, self)
         
+        # Findings are queued by the analysis threads and handed to the UI in batches on the EDT
+        self._pending = ConcurrentLinkedQueue()
+        self._drain_timer = Timer(self.UI_DRAIN_INTERVAL_MS, DrainAction(self))
+        self._drain_timer.start()
+        
         # Register listeners
         callbacks.registerContextMenuFactory(self)
         callbacks.registerProxyListener(self)
+        callbacks.registerExtensionStateListener(self)
         callbacks.addSuiteTab(self)
         
         self._log("JSCollector loaded - Passively collecting from proxied JS")
         self._log("Right-click JS responses for manual analysis")
         
-        settings = self.pattern_manager.get_settings()
-        if settings.get("passive_mode", True):
+        if self._settings_snapshot.get("passive_mode", True):
             self._log("Passive mode: ENABLED")
         else:
             self._log("Passive mode: DISABLED")
@@ -81,6 +145,10 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
     def getUiComponent(self):
         return self.panel
     
+    def extensionUnloaded(self):
+        self._drain_timer.stop()
+        self._pool.shutdownNow()
+    
     # ==================== PROXY LISTENER (Passive Collection) ====================
     
     def processProxyMessage(self, messageIsRequest, message):
@@ -90,7 +158,7 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
             return
         
         # Check if passive mode is enabled
-        settings = self.pattern_manager.get_settings()
+        settings = self._settings_snapshot
         if not settings.get("passive_mode", True):
             return
         
@@ -101,55 +169,50 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
             if not response:
                 return
             
-            # Get request info for URL and scope check
-            req_info = self._helpers.analyzeRequest(message_info)
-            url_obj = req_info.getUrl()
-            url_str = str(url_obj).lower()
-            
-            # Check scope if scope_only is enabled (using proper URL object)
-            if settings.get("scope_only", False):
-                if not self._callbacks.isInScope(url_obj):
-                    return
-            
-            # Check content type based on settings
+            # Check content type first - cheap, and rejects most proxied traffic
             resp_info = self._helpers.analyzeResponse(response)
-            headers = resp_info.getHeaders()
             
             collect_js = settings.get("collect_js", True)
             collect_html = settings.get("collect_html", False)
             
-            is_js = False
-            is_html = False
-            
-            for header in headers:
-                header_lower = str(header).lower()
-                if 'content-type:' in header_lower:
-                    if 'javascript' in header_lower or 'application/json' in header_lower:
-                        is_js = True
-                    elif 'text/html' in header_lower:
-                        is_html = True
-                    break
-            
-            # Also check URL extension for JS
-            if not is_js and (url_str.endswith('.js') or '.js?' in url_str):
-                is_js = True
-            
-            # Also check URL extension for HTML
-            if not is_html and (url_str.endswith('.html') or url_str.endswith('.htm') or '.html?' in url_str or '.htm?' in url_str):
-                is_html = True
+            # Burp already parsed Content-Type: "script", "JSON", "HTML", ...
+            mime = resp_info.getStatedMimeType() or resp_info.getInferredMimeType()
+            is_js = mime in ("script", "JSON")
+            is_html = mime == "HTML"
             
             # Determine if we should process this response
-            should_process = False
-            if collect_js and is_js:
-                should_process = True
-            if collect_html and is_html:
-                should_process = True
+            should_process = (collect_js and is_js) or (collect_html and is_html)
+            
+            # Only parse the request for URL-extension sniffing when the MIME type didn't qualify
+            url_obj = None
+            if not should_process and (collect_js or collect_html):
+                req_info = self._helpers.analyzeRequest(message_info)
+                url_obj = req_info.getUrl()
+                # Just the path - the query string is not part of it
+                path = url_obj.getPath().lower()
+                
+                # Also check URL extension for JS
+                if not is_js and path.endswith('.js'):
+                    is_js = True
+                
+                # Also check URL extension for HTML
+                if not is_html and path.endswith(HTML_EXTS):
+                    is_html = True
+                
+                should_process = (collect_js and is_js) or (collect_html and is_html)
             
             if not should_process:
                 return
             
-            # Analyze the response
-            self.analyze_response(message_info, passive=True)
+            # Check scope if scope_only is enabled (using proper URL object)
+            if settings.get("scope_only", False):
+                if url_obj is None:
+                    url_obj = self._helpers.analyzeRequest(message_info).getUrl()
+                if not self._callbacks.isInScope(url_obj):
+                    return
+            
+            # Analyze the response on a worker thread
+            self._pool.execute(AnalyzeTask(self, message_info))
             
         except Exception as e:
             self._log("Proxy error: " + str(e))
@@ -186,62 +249,115 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         # Get response body
         resp_info = self._helpers.analyzeResponse(response)
         body_offset = resp_info.getBodyOffset()
-        body = self._helpers.bytesToString(response[body_offset:])
+        body_length = len(response) - body_offset
+        
+        if body_length < 50:
+            return
         
-        if len(body) < 50:
+        # Fonts, wasm and images served with a script Content-Type
+        if not self._looks_like_text(response, body_offset, body_length):
+            if not passive:
+                self._log("Skipping binary response: " + url)
             return
         
+        # Skip bodies already scanned in passive mode; manual analysis always rescans
+        if passive:
+            fingerprint = self._fingerprint_body(response, body_offset, body_length)
+            if self._seen_bodies.put(fingerprint, True) is not None:
+                return
+        
+        # Oversized bodies (vendor bundles): scan only the first and last window
+        settings = self._settings_snapshot
+        max_scan = settings.get("max_scan_bytes", self.MAX_SCAN_BYTES)
+        window = settings.get("scan_window_bytes", self.SCAN_WINDOW_BYTES)
+        truncated = max_scan > 0 and body_length > max_scan and 2 * window < body_length
+        
+        # Decode straight from the response array (same byte->char mapping as
+        # bytesToString) - avoids copying the body slice first
+        if truncated:
+            body = (String(response, body_offset, window, "ISO-8859-1") + "\n" +
+                    String(response, len(response) - window, window, "ISO-8859-1"))
+        else:
+            body = String(response, body_offset, body_length, "ISO-8859-1")
+        
         # Short name for logging
         source_name = url.split('/')[-1].split('?')[0] if '/' in url else url
         if len(source_name) > 40:
             source_name = source_name[:40] + "..."
         
         prefix = "[Passive] " if passive else ""
-        self._log(prefix + "Analyzing: " + source_name)
+        if truncated:
+            self._log(prefix + "Analyzing: %s (first/last %d KB of %d KB)" % (source_name, window // 1024, body_length // 1024))
+        else:
+            self._log(prefix + "Analyzing: " + source_name)
         
         new_findings = []
         
-        # Get all categories from pattern manager
-        categories = self.pattern_manager.get_all_categories()
-        
-        for category in categories:
-            patterns = self.pattern_manager.get_patterns_for_category(category)
-            
-            for pattern, pattern_name in patterns:
-                for match in pattern.finditer(body):
-                    # Get the first captured group or the whole match
-                    value = match.group(1).strip() if match.lastindex else match.group(0).strip()
-                    
-                    # Validate based on category
-                    if category == "endpoints":
-                        if not self._is_valid_endpoint(value):
-                            continue
-                    elif category == "urls":
-                        if not self._is_valid_url(value):
-                            continue
-                    elif category == "secrets":
-                        if not self._is_valid_secret(value):
-                            continue
-                        # Mask secrets
-                        value = self._mask_secret(value)
-                    elif category == "emails":
-                        if not self._is_valid_email(value):
-                            continue
-                    elif category == "files":
-                        if not self._is_valid_file(value):
-                            continue
-                    
-                    finding = self._add_finding(category, value, url, pattern_name, message_info)
-                    if finding:
-                        new_findings.append(finding)
-        
-        # Update UI
+        for category in self._categories_snapshot:
+            for pattern_name, value in self.pattern_manager.scan(category, body):
+                # Validate based on category
+                if category == "endpoints":
+                    if not self._is_valid_endpoint(value):
+                        continue
+                elif category == "urls":
+                    if not self._is_valid_url(value):
+                        continue
+                elif category == "secrets":
+                    if not self._is_valid_secret(value):
+                        continue
+                    # Mask secrets
+                    value = self._mask_secret(value)
+                elif category == "emails":
+                    if not self._is_valid_email(value):
+                        continue
+                elif category == "files":
+                    if not self._is_valid_file(value):
+                        continue
+                
+                finding = self._add_finding(category, value, url, pattern_name, message_info)
+                if finding:
+                    new_findings.append(finding)
+        
+        # Queue for the UI
         if new_findings:
             self._log("Found %d new items" % len(new_findings))
-            self.panel.add_findings(new_findings, url)
+            self._pending.add((url, new_findings))
         elif not passive:
             self._log("No new findings")
     
+    def drain_pending(self):
+        """Hand all queued findings to the UI in one batch (runs on the EDT)."""
+        batch = []
+        item = self._pending.poll()
+        while item is not None:
+            batch.append(item)
+            item = self._pending.poll()
+        
+        if batch:
+            self.panel.add_findings_batch(batch)
+    
+    def _looks_like_text(self, response, body_offset, body_length):
+        """Sniff the first 4 KB of the body: no NUL bytes and at most 10% control bytes.
+        
+        Bytes >= 0x80 count as text so UTF-8 bodies pass.
+        """
+        sample = String(response, body_offset, min(body_length, self.TEXT_SNIFF_BYTES), "ISO-8859-1")
+        if '\x00' in sample:
+            return False
+        return len(BINARY_CHARS_RE.findall(sample)) * 10 <= len(sample)
+    
+    def _fingerprint_body(self, response, body_offset, body_length):
+        """SHA-256 of the body's first and last 64 KB, keyed with its length.
+        
+        Hashing just the edges keeps this cheap for multi-MB bundles.
+        """
+        digest = MessageDigest.getInstance("SHA-256")
+        head = min(body_length, self.FINGERPRINT_BYTES)
+        digest.update(response, body_offset, head)
+        if body_length > head:
+            digest.update(response, len(response) - head, head)
+        return "%d:%s" % (body_length, BigInteger(1, digest.digest()).toString(16))
+    
     def _mask_secret(self, value):
         """Mask a secret value for display."""
         if len(value) > 20:
@@ -249,21 +365,30 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         return value
     
     def _add_finding(self, category, value, source, pattern_name="", message_info=None):
-        """Add a finding if not duplicate."""
-        key = category + ":" + value
-        if key in self.seen_values:
-            return None
-        
-        self.seen_values.add(key)
-        finding = {
-            "category": category,
-            "value": value,
-            "source": source,
-            "pattern": pattern_name,
-            "message_info": message_info,
-        }
-        self.all_findings.append(finding)
-        return finding
+        """Add a finding if not duplicate. Safe to call from worker threads."""
+        with self._findings_lock:
+            seen = self.seen_values.get(category)
+            if seen is None:
+                seen = self.seen_values[category] = LruMap(
+                    self.get_max_findings(), False, self.get_findings_trim_size())
+                self.all_findings[category] = []
+            # put() returns the previous mapping for values already seen
+            if seen.put(value, True) is not None:
+                return None
+            
+            finding = {
+                "category": category,
+                "value": value,
+                "source": source,
+                "pattern": pattern_name,
+                "message_info": message_info,
+            }
+            findings = self.all_findings[category]
+            findings.append(finding)
+            # Dropped in step with the seen values - see LruMap
+            if len(findings) > seen.max_entries:
+                del findings[:len(findings) - seen.trim_to]
+            return finding
     
     # ==================== VALIDATION ====================
     
@@ -280,8 +405,7 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
             return False
         
         # Skip if just single segments
-        parts = value.split('/')
-        if len(parts) < 2 or all(len(p) < 2 for p in parts if p):
+        if not ENDPOINT_SEGMENT_RE.search(value):
             return False
         
         return True
@@ -305,8 +429,7 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
             return False
         
         # Skip static files
-        static_exts = ['.css', '.png', '.jpg', '.gif', '.svg', '.woff', '.ttf', '.ico']
-        if any(val_lower.endswith(ext) for ext in static_exts):
+        if val_lower.endswith(STATIC_EXTS):
             return False
         
         return True
@@ -316,9 +439,7 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         if not value or len(value) < 10:
             return False
         
-        val_lower = value.lower()
-        noise_words = ['example', 'placeholder', 'your', 'xxxx', 'test', 'sample', 'dummy']
-        if any(x in val_lower for x in noise_words):
+        if SECRET_NOISE_RE.search(value):
             return False
         
         return True
@@ -328,14 +449,11 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         if not value or '@' not in value:
             return False
         
-        domain = value.split('@')[-1].lower()
-        noise_domains = ['example.com', 'test.com', 'domain.com', 'placeholder.com', 'email.com']
-        if domain in noise_domains:
+        domain = value[value.rfind('@') + 1:].lower()
+        if domain in EMAIL_NOISE_DOMAINS:
             return False
         
-        val_lower = value.lower()
-        noise_words = ['example', 'test', 'placeholder', 'noreply', 'no-reply']
-        if any(x in val_lower for x in noise_words):
+        if EMAIL_NOISE_RE.search(value):
             return False
         
         return True
@@ -348,16 +466,11 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
         val_lower = value.lower()
         
         # Skip common build files
-        noise_files = [
-            'package.json', 'tsconfig.json', 'webpack', 'babel',
-            'eslint', 'prettier', 'node_modules', '.min.',
-            'polyfill', 'vendor', 'chunk', 'bundle', '.map'
-        ]
-        if any(x in val_lower for x in noise_files):
+        if FILE_NOISE_RE.search(val_lower):
             return False
         
         # Skip small locale JSON files
-        if val_lower.endswith('.json') and len(value.split('/')[-1]) <= 7:
+        if val_lower.endswith('.json') and len(value) - value.rfind('/') - 1 <= 7:
             return False
         
         return True
@@ -366,16 +479,124 @@ class BurpExtender(IBurpExtender, IContextMenuFactory, ITab, IProxyListener):
     
     def clear_results(self):
         """Clear all findings."""
-        self.all_findings = []
-        self.seen_values = set()
+        with self._findings_lock:
+            self._pending.clear()
+            self._seen_bodies.clear()
+            self.all_findings = {}
+            self.seen_values = {}
     
     def get_all_findings(self):
         """Get all findings."""
-        return self.all_findings
+        with self._findings_lock:
+            return [finding for findings in self.all_findings.values() for finding in findings]
+    
+    def get_max_findings(self):
+        """Get how many findings are kept per category."""
+        return self._settings_snapshot.get("max_findings", self.MAX_FINDINGS)
+    
+    def get_findings_trim_size(self):
+        """Get how many findings a category over max_findings is trimmed down to.
+        
+        Trimming below the cap makes dropping old findings a rare, batched
+        event rather than a list shift and table rebuild per new finding.
+        """
+        max_findings = self.get_max_findings()
+        return max_findings - max_findings // 10
+    
+    def get_settings_snapshot(self):
+        """Get the settings as of the last invalidate_cache (a new dict after every edit)."""
+        return self._settings_snapshot
+    
+    def get_search_min_length(self):
+        """Get the shortest search text the results panel filters on."""
+        return self._settings_snapshot.get("search_min_length", 0)
     
     def get_pattern_manager(self):
         """Get the pattern manager instance."""
         return self.pattern_manager
+    
+    def invalidate_cache(self):
+        """Refresh the settings and category snapshots used on the proxy path.
+        
+        Must be called whenever settings or patterns are edited.
+        """
+        self._settings_snapshot = dict(self.pattern_manager.get_settings())
+        self._categories_snapshot = tuple(self.pattern_manager.get_all_categories())
+        
+        # Apply a changed max_findings to the stores already filled
+        max_findings = self.get_max_findings()
+        trim_to = self.get_findings_trim_size()
+        with self._findings_lock:
+            for category, seen in self.seen_values.items():
+                if seen.max_entries != max_findings:
+                    seen.set_max_entries(max_findings, trim_to)
+                    findings = self.all_findings[category]
+                    if len(findings) > max_findings:
+                        del findings[:len(findings) - trim_to]
+        
+        # Patterns may have changed, so previously scanned bodies are worth another pass
+        self._seen_bodies.clear()
+
+
+class LruMap(LinkedHashMap):
+    """LinkedHashMap capped at max_entries.
+    
+    Access-ordered by default, evicting the least recently used entry;
+    with access_order=False it evicts the oldest inserted entry instead.
+    With trim_to below max_entries, going over the cap evicts the eldest
+    entries down to trim_to at once.
+    """
+    
+    def __init__(self, max_entries, access_order=True, trim_to=None):
+        LinkedHashMap.__init__(self, 16, 0.75, access_order)
+        self.max_entries = max_entries
+        self.trim_to = max_entries if trim_to is None else trim_to
+    
+    def set_max_entries(self, max_entries, trim_to=None):
+        """Change the cap, evicting the eldest entries if it is exceeded."""
+        self.max_entries = max_entries
+        self.trim_to = max_entries if trim_to is None else trim_to
+        if self.size() > max_entries:
+            self._trim()
+    
+    def _trim(self):
+        keys = self.keySet().iterator()
+        while self.size() > self.trim_to:
+            keys.next()
+            keys.remove()
+    
+    def removeEldestEntry(self, eldest):
+        if self.size() <= self.max_entries:
+            return False
+        if self.trim_to >= self.max_entries:
+            return True
+        # The map may be modified here, as long as False is returned
+        self._trim()
+        return False
+
+
+class DrainAction(ActionListener):
+    """Timer action that flushes queued findings to the results panel."""
+    
+    def __init__(self, extender):
+        self.extender = extender
+    
+    def actionPerformed(self, event):
+        self.extender.drain_pending()
+
+
+class AnalyzeTask(Runnable):
+    """Worker-pool task for passive analysis of one proxied response."""
+    
+    def __init__(self, extender, message_info):
+        self.extender = extender
+        self.message_info = message_info
+    
+    def run(self):
+        try:
+            self.extender.analyze_response(self.message_info, passive=True)
+        except Exception as e:
+            self.extender._log("Analysis error: " + str(e))
 
 
 class AnalyzeAction(ActionListener):
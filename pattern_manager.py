@@ -7,6 +7,140 @@ Manages built-in and custom regex patterns for JS analysis.
 import os
 import re
 import json
+import threading
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    _chr = unichr
+except NameError:  # Python 3
+    _chr = chr
+
+
+# Compiled built-in patterns, shared by every PatternManager in the process:
+# category -> (patterns, scanners), plus "noise" -> (noise regex, noise domain regex)
+_BUILTIN_COMPILED = {}
+
+# Display names of the built-in categories
+_BUILTIN_DISPLAY_NAMES = {
+    "endpoints": "Endpoints",
+    "urls": "URLs",
+    "secrets": "Secrets",
+    "emails": "Emails",
+    "files": "Files",
+}
+
+# File extensions for the built-in file pattern. Most frequent first, and a
+# longer extension before its own prefix (xlsx/xls, config/conf, docx/doc)
+# so the engine doesn't try the short one and backtrack at the closing quote.
+_FILE_EXTENSIONS = (
+    'json', 'xml', 'txt', 'csv', 'sql', 'yaml', 'yml', 'xlsx', 'xls',  # Data files
+    'log', 'config', 'conf', 'cfg', 'ini', 'env',                     # Config/logs
+    'backup', 'bak', 'old', 'orig', 'copy',                           # Backups
+    'key', 'pem', 'crt', 'cer', 'p12', 'pfx',                         # Certificates
+    'pdf', 'docx', 'doc',                                             # Documents
+    'zip', 'tar', 'gz', 'rar', '7z',                                  # Archives
+    'sh', 'bat', 'ps1', 'py', 'rb', 'pl',                             # Scripts
+)
+
+# Custom pattern lists for the built-in categories: config key and compile flags
+_CUSTOM_PATTERN_KEYS = {
+    "endpoints": ("custom_endpoints", re.IGNORECASE),
+    "urls": ("custom_urls", 0),
+    "secrets": ("custom_secrets", 0),
+}
+
+# Characters of an email's local part, as a character class body
+_EMAIL_LOCAL_CHARS = r'a-zA-Z0-9._%+-'
+
+
+def _parsed_class(body):
+    """Characters of a regex character class body such as "a-z0-9._"."""
+    chars = []
+    for op, av in sre_parse.parse("[%s]" % body)[0][1]:
+        if op is sre_parse.LITERAL:
+            chars.append(_chr(av))
+        else:  # RANGE
+            chars.extend(_chr(c) for c in range(av[0], av[1] + 1))
+    return chars
+
+
+class _AtScanner(object):
+    """finditer() for a "[local part]+@..." pattern that only starts work at an "@".
+    
+    A plain finditer() retries the pattern at every offset of a long run of
+    local-part characters with no "@" after it, which is quadratic. The local
+    part of every match ends right before an "@", so the leftmost match from
+    a position starts at the beginning of the local-part run before the
+    first "@" that completes one. Matching once from there gives exactly the
+    matches finditer() would.
+    """
+    
+    def __init__(self, compiled, local_chars):
+        self.compiled = compiled
+        self._local = frozenset(_parsed_class(local_chars))
+    
+    def finditer(self, text):
+        match_at = self.compiled.match
+        local = self._local
+        pos = 0
+        at = text.find("@")
+        while at != -1:
+            start = at
+            while start > pos and text[start - 1] in local:
+                start -= 1
+            if start < at:
+                match = match_at(text, start)
+                if match is not None:
+                    yield match
+                    pos = match.end()
+                    at = text.find("@", pos)
+                    continue
+            at = text.find("@", at + 1)
+
+
+def _literal_prefixes(regex, flags):
+    """Literal prefixes of which every match of regex must contain one.
+    
+    Walks the parsed pattern through leading literals, groups and
+    alternations (e.g. "(?:mongodb|postgres)://" gives both names).
+    Returns an empty tuple when some match could start without a literal
+    or the pattern is case-insensitive.
+    """
+    if flags & re.IGNORECASE:
+        return ()
+    try:
+        prefixes = _parsed_prefixes(sre_parse.parse(regex, flags))
+    except Exception:
+        return ()
+    return tuple(sorted(set(prefixes))) if prefixes and all(prefixes) else ()
+
+
+def _parsed_prefixes(items):
+    """Literal prefixes of a parsed (sub)pattern; an empty string means none."""
+    literal = []
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            literal.append(_chr(av))
+        elif op is sre_parse.AT:
+            continue  # \b, ^ - zero width
+        elif op is sre_parse.SUBPATTERN:
+            head = "".join(literal)
+            # (group, add_flags, del_flags, pattern) on Python 3.6+: a scoped
+            # (?i:...) makes the rest case-insensitive, so no literal is required
+            if len(av) == 4 and av[1] & re.IGNORECASE:
+                return [head]
+            return [head + p for p in _parsed_prefixes(av[-1])]
+        elif op is sre_parse.BRANCH:
+            head = "".join(literal)
+            alternatives = [_parsed_prefixes(branch) for branch in av[1]]
+            return [head + p for prefixes in alternatives for p in prefixes]
+        else:
+            break
+    return ["".join(literal)]
 
 
 class PatternManager:
@@ -24,6 +158,7 @@ class PatternManager:
         
         self.config_path = config_path
         self.config = self._load_config()
+        self.version = 0  # bumped whenever the in-memory config changes
         
         # Built-in patterns
         self._init_builtin_patterns()
@@ -32,44 +167,41 @@ class PatternManager:
         """Initialize built-in patterns."""
         
         # ==================== ENDPOINT PATTERNS ====================
-        # Generic endpoint pattern based on LinkFinder regex
+        # Generic endpoint pattern based on LinkFinder regex, narrowed to values
+        # starting with "/" - the only ones _is_valid_endpoint accepts - so
+        # candidates it would reject never leave the regex engine
+        # Compiled without IGNORECASE: every class already lists both cases
         self.builtin_endpoints = [
-            # Full URL with scheme (http/https or protocol-relative //)
+            # Protocol-relative URL (//host/...). The domain is checked once by a
+            # lookahead, so an unterminated "//ab.ab.ab..." run fails in linear time
             (r'''(?:"|')'''
-             r'''((?:[a-zA-Z]{1,10}://|//)'''  # Match a scheme [a-Z]*1-10 or //
-             r'''[^"'/]{1,}\.'''               # Match a domainname (any character + dot)
-             r'''[a-zA-Z]{2,}[^"']{0,})'''     # The domainextension and/or path
+             r'''(//'''                        # Match //
+             r'''(?=[^"'/]+\.[a-zA-Z]{2})'''   # A domainname (any character + dot + extension)
+             r'''[^"']+)'''                    # The domain and/or path
              r'''(?:"|')''', "URL"),
             
-            # Relative paths starting with /,../,./
+            # Relative paths starting with /
             (r'''(?:"|')'''
-             r'''((?:/|\.\./|\./)'''           # Start with /,../,./
+             r'''(/'''                         # Start with /
              r'''[^"'><,;| *()(%%$^/\\\[\]]''' # Next character can't be...
              r'''[^"'><,;|()]{1,})'''          # Rest of the characters can't be
              r'''(?:"|')''', "Relative Path"),
             
             # Relative endpoint with extension
             (r'''(?:"|')'''
-             r'''([a-zA-Z0-9_\-/]{1,}/'''      # Relative endpoint with /
-             r'''[a-zA-Z0-9_\-/.]{1,}'''       # Resource name
-             r'''\.(?:[a-zA-Z]{1,4}|action)''' # Rest + extension (length 1-4 or action)
+             r'''(/[a-zA-Z0-9_\-]{0,}/'''      # Relative endpoint with / (slash-free first
+             r'''[a-zA-Z0-9_\-/.]{1,}'''       # segment: one way to split) + resource name
+             r'''\.(?:[a-zA-Z]{1,4}'''         # Rest + extension (length 1-4
+             r'''|[aA][cC][tT][iI][oO][nN])''' # or action, in any case)
              r'''(?:[\?|#][^"|']{0,}|))'''     # ? or # mark with parameters
              r'''(?:"|')''', "Endpoint"),
             
             # REST API (no extension) with /
             (r'''(?:"|')'''
-             r'''([a-zA-Z0-9_\-/]{1,}/'''      # REST API (no extension) with /
+             r'''(/[a-zA-Z0-9_\-]{0,}/'''      # REST API (no extension) with /
              r'''[a-zA-Z0-9_\-/]{3,}'''        # Proper REST endpoints usually have 3+ chars
              r'''(?:[\?|#][^"|']{0,}|))'''     # ? or # mark with parameters
              r'''(?:"|')''', "REST API"),
-            
-            # Filename with common extensions
-            (r'''(?:"|')'''
-             r'''([a-zA-Z0-9_\-]{1,}'''        # filename
-             r'''\.(?:php|asp|aspx|jsp|json|'''
-             r'''action|html|js|txt|xml)'''   # . + extension
-             r'''(?:[\?|#][^"|']{0,}|))'''    # ? or # mark with parameters
-             r'''(?:"|')''', "File"),
         ]
         
         # ==================== URL PATTERNS ====================
@@ -77,8 +209,9 @@ class PatternManager:
             (r'["\'](https?://[^\s"\'<>]{10,})["\']', "HTTP URL"),
             (r'["\'](wss?://[^\s"\'<>]{10,})["\']', "WebSocket"),
             (r'["\'](sftp://[^\s"\'<>]{10,})["\']', "SFTP"),
-            # Cloud storage
-            (r'(https?://[a-zA-Z0-9.-]+\.s3[a-zA-Z0-9.-]*\.amazonaws\.com[^\s"\'<>]*)', "AWS S3"),
+            # Cloud storage. The S3 host is matched up to its first ".s3" once - the
+            # lookahead can't be backtracked into - instead of retrying every ".s3"
+            (r'(https?://(?=([a-zA-Z0-9.-]+?\.s3))\2[a-zA-Z0-9.-]*\.amazonaws\.com[^\s"\'<>]*)', "AWS S3"),
             (r'(https?://[a-zA-Z0-9.-]+\.blob\.core\.windows\.net[^\s"\'<>]*)', "Azure Blob"),
             (r'(https?://storage\.googleapis\.com/[^\s"\'<>]*)', "GCP Storage"),
         ]
@@ -112,23 +245,16 @@ class PatternManager:
         ]
         
         # ==================== EMAIL PATTERN ====================
-        self.email_pattern = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,6})'
+        # Scanned with _AtScanner, which only tries it next to an "@" (see there)
+        self.email_pattern = r'([' + _EMAIL_LOCAL_CHARS + r']+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,6})'
         
         # ==================== FILE PATTERNS ====================
         self.file_pattern = (
-            r'["\']([a-zA-Z0-9_/.-]+\.(?:'
-            r'sql|csv|xlsx|xls|json|xml|yaml|yml|'  # Data files
-            r'txt|log|conf|config|cfg|ini|env|'      # Config/logs
-            r'bak|backup|old|orig|copy|'              # Backups
-            r'key|pem|crt|cer|p12|pfx|'               # Certificates
-            r'doc|docx|pdf|'                          # Documents
-            r'zip|tar|gz|rar|7z|'                     # Archives
-            r'sh|bat|ps1|py|rb|pl'                    # Scripts
-            r'))["\']'
+            r'["\']([a-zA-Z0-9_/.-]+\.(?:' + '|'.join(_FILE_EXTENSIONS) + r'))["\']'
         )
         
         # ==================== NOISE FILTERS ====================
-        self.noise_domains = {
+        self.noise_domains = frozenset((
             'www.w3.org', 'schemas.openxmlformats.org', 'schemas.microsoft.com',
             'purl.org', 'purl.oclc.org', 'openoffice.org', 'docs.oasis-open.org',
             'sheetjs.openxmlformats.org', 'ns.adobe.com', 'www.xml.org',
@@ -137,7 +263,7 @@ class PatternManager:
             'npmjs.org', 'registry.npmjs.org',
             'github.com/indutny', 'github.com/crypto-browserify',
             'jqwidgets.com', 'ag-grid.com',
-        }
+        ))
         
         self.noise_patterns = [
             r'^\.\./|^\./',  # Module imports
@@ -156,87 +282,179 @@ class PatternManager:
             r'^http://$|_ngcontent',  # Empty/Angular internals
         ]
         
-        self.noise_strings = {
+        self.noise_strings = frozenset((
             'http://', 'https://', '/a', '/P', '/R', '/V', '/W',
             'zone.js', 'bn.js', 'hash.js', 'md5.js', 'sha.js', 'des.js',
             'asn1.js', 'declare.js', 'elliptic.js',
-        }
+        ))
         
         # Compile patterns
         self._compile_patterns()
     
     def _compile_patterns(self):
-        """Compile all regex patterns."""
-        # Compile built-in patterns
-        self.compiled_endpoints = [
-            (re.compile(p, re.IGNORECASE), name) for p, name in self.builtin_endpoints
-        ]
-        self.compiled_urls = [
-            (re.compile(p), name) for p, name in self.builtin_urls
-        ]
-        self.compiled_secrets = [
-            (re.compile(p), name) for p, name in self.builtin_secrets
-        ]
-        self.compiled_email = re.compile(self.email_pattern)
-        self.compiled_file = re.compile(self.file_pattern, re.IGNORECASE)
-        self.compiled_noise = [re.compile(p) for p in self.noise_patterns]
+        """Compile the noise filters and custom patterns.
+        
+        Built-in category patterns are compiled lazily, on first use, by
+        _compile_builtin - see _category_tables.
+        """
+        noise = _BUILTIN_COMPILED.get("noise")
+        if noise is None:
+            # Noise values are short, so one alternation beats a search per pattern
+            compiled_noise = re.compile("|".join("(?:%s)" % p for p in self.noise_patterns))
+            # A domain containing another one (registry.npmjs.org / npmjs.org) can never add a match
+            domains = sorted(set(d.lower() for d in self.noise_domains))
+            domains = [d for d in domains if not any(o != d and o in d for o in domains)]
+            compiled_domains = re.compile("|".join(re.escape(d) for d in domains), re.IGNORECASE)
+            noise = _BUILTIN_COMPILED["noise"] = (compiled_noise, compiled_domains)
+        self.compiled_noise, self.compiled_noise_domains = noise
+        
+        # Built-in categories: (patterns, flags, literals every match must contain).
+        # Categories with required literals are skipped when they are absent.
+        self._builtin_specs = {
+            "endpoints": (self.builtin_endpoints, 0, ("/",)),
+            "urls": (self.builtin_urls, 0, ("://",)),
+            "secrets": (self.builtin_secrets, 0, ()),
+            "emails": ([(self.email_pattern, "Email")], 0, ("@",)),
+            "files": ([(self.file_pattern, "File")], re.IGNORECASE, ()),
+        }
         
         # Compile custom patterns
         self._compile_custom_patterns()
+        
+        # Warm the built-in categories off the extension load path. A scan that
+        # gets there first compiles what it needs itself (see _compile_builtin).
+        if any(category not in _BUILTIN_COMPILED for category in self._builtin_specs):
+            warm = threading.Thread(target=self._warm_builtin, name="JSCollector pattern compile")
+            warm.daemon = True
+            warm.start()
+    
+    def _warm_builtin(self):
+        """Compile every built-in category (background thread)."""
+        for category in self._builtin_specs:
+            self._compile_builtin(category)
+    
+    def _compile_builtin(self, category):
+        """Compile a built-in category once per process; returns (patterns, scanners) tuples."""
+        compiled = _BUILTIN_COMPILED.get(category)
+        if compiled is None:
+            patterns, flags, required = self._builtin_specs[category]
+            patterns = tuple((re.compile(p, flags), name) for p, name in patterns)
+            scanners = self._build_scanners(patterns, required)
+            if category == "emails":
+                scanners = [(_AtScanner(c, _EMAIL_LOCAL_CHARS), value_group, name, req)
+                            for c, value_group, name, req in scanners]
+            compiled = (patterns, tuple(scanners))
+            _BUILTIN_COMPILED[category] = compiled
+        return compiled
+    
+    def _build_scanners(self, patterns, required=()):
+        """Turn (compiled, name) pairs into scanners, one finditer() pass per pattern.
+        
+        Returns list of (compiled, value_group, name, required) tuples. required
+        lists literals of which at least one must occur in the body for the
+        scanner to be worth running (empty = always run): the pattern's own
+        literal prefixes when it has them, otherwise the category-wide literals
+        passed in.
+        """
+        scanners = []
+        for compiled, name in patterns:
+            literals = _literal_prefixes(compiled.pattern, compiled.flags)
+            value_group = 1 if compiled.groups else 0
+            scanners.append((compiled, value_group, name, literals or required))
+        return scanners
     
     def _compile_custom_patterns(self):
         """Compile custom patterns from config."""
-        self.custom_compiled = {
-            "endpoints": [],
-            "urls": [],
-            "secrets": [],
-        }
+        self.custom_compiled = {}
+        self.custom_scanners = {}
+        self.custom_categories_compiled = {}
+        # Regexes that failed to compile - skipped without reparsing on later edits
+        self._bad_patterns = set()
         
-        for pattern in self.config.get("custom_endpoints", []):
-            try:
-                compiled = re.compile(pattern["regex"], re.IGNORECASE)
-                self.custom_compiled["endpoints"].append((compiled, pattern.get("name", "Custom")))
-            except re.error:
-                pass
+        for category in _CUSTOM_PATTERN_KEYS:
+            self._compile_custom_category(category)
+        for cat_key in self.config.get("custom_categories", {}):
+            self._compile_custom_category(cat_key)
         
-        for pattern in self.config.get("custom_urls", []):
-            try:
-                compiled = re.compile(pattern["regex"])
-                self.custom_compiled["urls"].append((compiled, pattern.get("name", "Custom")))
-            except re.error:
-                pass
+        self._merge_compiled()
+    
+    def _compile_custom_category(self, category):
+        """(Re)compile the custom patterns of a single category.
         
-        for pattern in self.config.get("custom_secrets", []):
+        Used on add/remove so an edit only recompiles the category it touches.
+        Call _merge_compiled() afterwards to publish the result.
+        """
+        if category in _CUSTOM_PATTERN_KEYS:
+            config_key, flags = _CUSTOM_PATTERN_KEYS[category]
+            cat_data = None
+            entries = self.config.get(config_key, [])
+        else:
+            flags = re.IGNORECASE
+            cat_data = self.config.get("custom_categories", {}).get(category, {})
+            entries = cat_data.get("patterns", [])
+        
+        patterns = []
+        for pattern in entries:
+            regex = pattern["regex"]
+            if regex in self._bad_patterns:
+                continue
             try:
-                compiled = re.compile(pattern["regex"])
-                self.custom_compiled["secrets"].append((compiled, pattern.get("name", "Custom")))
+                compiled = re.compile(regex, flags)
             except re.error:
-                pass
+                self._bad_patterns.add(regex)
+                continue
+            patterns.append((compiled, pattern.get("name", "Custom")))
+        scanners = self._build_scanners(patterns)
+        
+        if cat_data is None:
+            self.custom_compiled[category] = patterns
+            self.custom_scanners[category] = scanners
+        elif patterns:
+            self.custom_categories_compiled[category] = {
+                "display_name": cat_data.get("display_name", category),
+                "patterns": patterns
+            }
+            self.custom_scanners[category] = scanners
+        else:
+            self.custom_categories_compiled.pop(category, None)
+            self.custom_scanners.pop(category, None)
+    
+    def _merge_compiled(self):
+        """Drop the merged per-category tables after custom patterns changed."""
+        self._category_cache = {}
+    
+    def _category_tables(self, category):
+        """(patterns, scanners) tuples for a category, built-in + custom.
         
-        # Compile custom categories
-        self.custom_categories_compiled = {}
-        for cat_key, cat_data in self.config.get("custom_categories", {}).items():
-            patterns = []
-            for pattern in cat_data.get("patterns", []):
-                try:
-                    compiled = re.compile(pattern["regex"], re.IGNORECASE)
-                    patterns.append((compiled, pattern.get("name", "Custom")))
-                except re.error:
-                    pass
-            if patterns:
-                self.custom_categories_compiled[cat_key] = {
-                    "display_name": cat_data.get("display_name", cat_key),
-                    "patterns": patterns
-                }
+        Merged on first use and memoised, so the getters are a dict lookup
+        instead of a list concatenation on every response. Worker threads
+        may race to fill an entry; both compute the same tuples.
+        """
+        cache = self._category_cache
+        tables = cache.get(category)
+        if tables is None:
+            if category in self._builtin_specs:
+                patterns, scanners = self._compile_builtin(category)
+                patterns = patterns + tuple(self.custom_compiled.get(category, ()))
+            else:
+                patterns = tuple(self.custom_categories_compiled.get(category, {}).get("patterns", ()))
+                scanners = ()
+            tables = (patterns, scanners + tuple(self.custom_scanners.get(category, ())))
+            cache[category] = tables
+        return tables
     
     def _load_config(self):
         """Load config from JSON file."""
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
-            except (IOError, ValueError):
-                pass
+        # A missing file is just another IOError - no separate exists() stat
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+            self._saved_json = json.dumps(config, indent=2)
+            return config
+        except (IOError, ValueError):
+            pass
+        
+        self._saved_json = None
         
         # Return default config
         return {
@@ -249,22 +467,54 @@ class PatternManager:
                 "passive_mode": True,
                 "scope_only": False,
                 "collect_js": True,
-                "collect_html": False
+                "collect_html": False,
+                "max_scan_bytes": 2 * 1024 * 1024,
+                "scan_window_bytes": 256 * 1024,
+                "max_findings": 100000,
+                "search_min_length": 0
             }
         }
     
     def save_config(self):
-        """Save current config to JSON file."""
+        """Save current config to JSON file.
+        
+        Skipped when the config is unchanged since it was last loaded or saved;
+        otherwise bumps version so views of the config know to refresh. The
+        bump happens before the write: callers have already changed (and may
+        recompile) the in-memory config, so it is live even if saving fails.
+        Written to a temp file first and renamed over the config, so a failed
+        write can't leave a truncated file behind.
+        """
+        data = json.dumps(self.config, indent=2)
+        if data == self._saved_json:
+            return True
+        self.version += 1
+        
+        tmp_path = self.config_path + ".tmp"
         try:
             config_dir = os.path.dirname(self.config_path)
             if not os.path.exists(config_dir):
                 os.makedirs(config_dir)
             
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            return True
-        except IOError:
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            try:
+                os.rename(tmp_path, self.config_path)
+            except OSError:
+                # Windows can't rename over an existing file
+                os.remove(self.config_path)
+                os.rename(tmp_path, self.config_path)
+        except (IOError, OSError):
+            # Don't leave a partial temp file next to the config
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
             return False
+        
+        self._saved_json = data
+        return True
     
     def get_settings(self):
         """Get current settings."""
@@ -285,15 +535,9 @@ class PatternManager:
     
     def get_category_display_name(self, category):
         """Get display name for a category."""
-        builtin_names = {
-            "endpoints": "Endpoints",
-            "urls": "URLs",
-            "secrets": "Secrets",
-            "emails": "Emails",
-            "files": "Files"
-        }
-        if category in builtin_names:
-            return builtin_names[category]
+        name = _BUILTIN_DISPLAY_NAMES.get(category)
+        if name is not None:
+            return name
         
         cat_data = self.custom_categories_compiled.get(category, {})
         return cat_data.get("display_name", category.title())
@@ -333,7 +577,8 @@ class PatternManager:
             self.config["custom_categories"][category]["patterns"].append(pattern_entry)
         
         self.save_config()
-        self._compile_custom_patterns()
+        self._compile_custom_category(category)
+        self._merge_compiled()
         return True, None
     
     def add_custom_category(self, key, display_name):
@@ -353,8 +598,8 @@ class PatternManager:
             "display_name": display_name,
             "patterns": []
         }
+        # Nothing to compile until the category gets a pattern
         self.save_config()
-        self._compile_custom_patterns()
         return True, None
     
     def remove_custom_pattern(self, category, index):
@@ -380,7 +625,8 @@ class PatternManager:
                     del self.config["custom_categories"][category]["patterns"][index]
             
             self.save_config()
-            self._compile_custom_patterns()
+            self._compile_custom_category(category)
+            self._merge_compiled()
             return True, None
         except (IndexError, KeyError) as e:
             return False, "Pattern not found: " + str(e)
@@ -388,36 +634,45 @@ class PatternManager:
     def get_patterns_for_category(self, category):
         """Get all patterns for a category (built-in + custom).
         
-        Returns list of (compiled_pattern, name) tuples.
+        Returns tuple of (compiled_pattern, name) tuples.
         """
-        if category == "endpoints":
-            return self.compiled_endpoints + self.custom_compiled.get("endpoints", [])
-        elif category == "urls":
-            return self.compiled_urls + self.custom_compiled.get("urls", [])
-        elif category == "secrets":
-            return self.compiled_secrets + self.custom_compiled.get("secrets", [])
-        elif category == "emails":
-            return [(self.compiled_email, "Email")]
-        elif category == "files":
-            return [(self.compiled_file, "File")]
-        elif category in self.custom_categories_compiled:
-            return self.custom_categories_compiled[category]["patterns"]
-        return []
+        return self._category_tables(category)[0]
+    
+    def get_scanners(self, category):
+        """Get scanners for a category (built-in + custom).
+        
+        Returns tuple of (compiled, value_group, name, required) tuples - see _build_scanners.
+        """
+        return self._category_tables(category)[1]
+    
+    def scan(self, category, text):
+        """Yield (pattern_name, value) for every match of a category's patterns in text.
+        
+        value is the pattern's first captured group (or its whole match when it
+        has none or the group didn't take part), stripped of whitespace.
+        """
+        for compiled, value_group, name, required in self.get_scanners(category):
+            # Cheap substring prefilter before walking the text with the regex
+            if required and not any(literal in text for literal in required):
+                continue
+            
+            for match in compiled.finditer(text):
+                value = match.group(value_group)
+                if value is None:
+                    value = match.group(0)
+                yield name, value.strip()
     
     def get_custom_patterns_list(self, category):
         """Get list of custom patterns for a category (for UI display).
         
-        Returns list of dicts with 'regex' and 'name' keys.
+        Returns a new list of (name, regex) tuples, so callers neither do dict
+        lookups per row nor hold on to the live config list.
         """
-        if category == "endpoints":
-            return self.config.get("custom_endpoints", [])
-        elif category == "urls":
-            return self.config.get("custom_urls", [])
-        elif category == "secrets":
-            return self.config.get("custom_secrets", [])
-        elif category in self.config.get("custom_categories", {}):
-            return self.config["custom_categories"][category].get("patterns", [])
-        return []
+        if category in _CUSTOM_PATTERN_KEYS:
+            entries = self.config.get(_CUSTOM_PATTERN_KEYS[category][0], [])
+        else:
+            entries = self.config.get("custom_categories", {}).get(category, {}).get("patterns", [])
+        return [(p.get("name", ""), p.get("regex", "")) for p in entries]
     
     def is_noise(self, value):
         """Check if a value matches noise patterns."""
@@ -427,20 +682,11 @@ class PatternManager:
         if value in self.noise_strings:
             return True
         
-        for pattern in self.compiled_noise:
-            if pattern.search(value):
-                return True
-        
-        return False
+        return self.compiled_noise.search(value) is not None
     
     def is_noise_domain(self, url):
         """Check if a URL contains a noise domain."""
         if not url:
             return True
         
-        url_lower = url.lower()
-        for domain in self.noise_domains:
-            if domain in url_lower:
-                return True
-        
-        return False
+        return self.compiled_noise_domains.search(url) is not None
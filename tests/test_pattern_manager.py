@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the pattern manager. Plain unittest, so they run under CPython and Jython.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pattern_manager import PatternManager
+
+
+class PatternManagerTestCase(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.pm = PatternManager(os.path.join(self.tmp_dir, "patterns.json"))
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class BacktrackingTest(PatternManagerTestCase):
+    """Hostile bodies must not make a built-in pattern backtrack for seconds."""
+    
+    TIME_LIMIT = 0.5
+    
+    def assert_fast(self, category, text):
+        start = time.time()
+        findings = list(self.pm.scan(category, text))
+        elapsed = time.time() - start
+        self.assertTrue(elapsed < self.TIME_LIMIT,
+                        "%s scan of %d chars took %.2fs" % (category, len(text), elapsed))
+        return findings
+    
+    def test_unterminated_protocol_relative_url(self):
+        self.assertEqual(self.assert_fast("endpoints", "'//" + "ab." * 10000), [])
+    
+    def test_protocol_relative_url_still_matches(self):
+        self.assertIn(("URL", "//cdn.example.net/app.js"),
+                      list(self.pm.scan("endpoints", "x = '//cdn.example.net/app.js';")))
+    
+    def test_unterminated_slash_runs(self):
+        self.assertEqual(self.assert_fast("endpoints", "'/" + "a/" * 10000), [])
+    
+    def test_s3_host_without_amazonaws(self):
+        self.assertEqual(self.assert_fast("urls", "'https://" + "a.s3" * 8000), [])
+    
+    def test_s3_url_still_matches(self):
+        self.assertEqual(list(self.pm.scan("urls", "https://a.s3.x.s3.amazonaws.com/k")),
+                         [("AWS S3", "https://a.s3.x.s3.amazonaws.com/k")])
+    
+    def test_local_part_without_at(self):
+        self.assertEqual(self.assert_fast("emails", "a" * 30000), [])
+
+
+class SaveConfigTest(PatternManagerTestCase):
+    
+    def test_save_bumps_version(self):
+        self.assertEqual(self.pm.add_custom_pattern("secrets", r"tok_[0-9a-f]{8}", "Token"), (True, None))
+        self.assertEqual(self.pm.version, 1)
+        self.assertTrue(os.path.exists(self.pm.config_path))
+    
+    def test_unchanged_save_skips_write(self):
+        self.pm.add_custom_pattern("secrets", r"tok_[0-9a-f]{8}", "Token")
+        os.remove(self.pm.config_path)
+        self.assertTrue(self.pm.save_config())
+        self.assertFalse(os.path.exists(self.pm.config_path))
+        self.assertEqual(self.pm.version, 1)
+    
+    def test_failed_save_still_bumps_version(self):
+        # A regular file where the config directory should be
+        blocker = os.path.join(self.tmp_dir, "blocker")
+        open(blocker, "w").close()
+        self.pm.config_path = os.path.join(blocker, "patterns.json")
+        
+        self.pm.add_custom_pattern("secrets", r"tok_[0-9a-f]{8}", "Token")
+        self.assertEqual(self.pm.version, 1)
+        self.assertEqual(list(self.pm.scan("secrets", "tok_0123abcd")), [("Token", "tok_0123abcd")])
+    
+    def test_failed_rename_removes_temp_file(self):
+        # A directory where the config file should be
+        os.mkdir(self.pm.config_path)
+        open(os.path.join(self.pm.config_path, "keep"), "w").close()
+        
+        self.pm.config["settings"]["scope_only"] = True
+        self.assertFalse(self.pm.save_config())
+        self.assertEqual(self.pm.version, 1)
+        self.assertFalse(os.path.exists(self.pm.config_path + ".tmp"))
+        
+        # The failed save is retried next time
+        shutil.rmtree(self.pm.config_path)
+        self.assertTrue(self.pm.save_config())
+        self.assertTrue(os.path.exists(self.pm.config_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
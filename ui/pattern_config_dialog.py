@@ -7,19 +7,31 @@ UI for managing custom regex patterns and categories.
 from javax.swing import (
     JDialog, JPanel, JScrollPane, JTabbedPane, JButton, JLabel,
     JTable, JComboBox, JTextField, JTextArea, BorderFactory,
-    JOptionPane, BoxLayout, Box
+    JOptionPane, BoxLayout, Box, SwingWorker, DefaultComboBoxModel, Timer
 )
+from javax.swing.event import ChangeListener
 from javax.swing.table import DefaultTableModel
 from java.awt import BorderLayout, FlowLayout, GridBagLayout, GridBagConstraints, Insets, Font, Dimension
 from java.awt.event import ActionListener
+from java.lang import String
+from java.util import Vector
+from java.util.concurrent import ExecutionException
+from jarray import array
+
+# Column identifiers, converted to java.lang.String once per load
+PATTERN_COLUMNS = (String("Name"), String("Regex"))
+CATEGORY_COLUMNS = (String("Key"), String("Display Name"), String("Patterns"))
 
 
 class PatternConfigDialog(JDialog):
     """Dialog for managing custom patterns and categories."""
     
-    def __init__(self, parent, pattern_manager):
+    def __init__(self, parent, pattern_manager, callbacks):
         JDialog.__init__(self, parent, "JSCollector Settings", True)
         self.pattern_manager = pattern_manager
+        self.callbacks = callbacks
+        self._refreshed_state = None  # (config version, category) last shown
+        self._jstrings = {}  # cell value -> java.lang.String, reused across refreshes
         
         self.setSize(700, 500)
         self.setLocationRelativeTo(parent)
@@ -38,11 +50,15 @@ class PatternConfigDialog(JDialog):
         # Patterns tab
         self.tabs.addTab("Custom Patterns", self._create_patterns_panel())
         
-        # Categories tab
-        self.tabs.addTab("Custom Categories", self._create_categories_panel())
-        
-        # Settings tab
-        self.tabs.addTab("Settings", self._create_settings_panel())
+        # Categories and Settings tabs are built the first time they are shown
+        self.categories_model = None
+        self._tab_builders = {
+            1: self._create_categories_panel,
+            2: self._create_settings_panel,
+        }
+        self.tabs.addTab("Custom Categories", JPanel())
+        self.tabs.addTab("Settings", JPanel())
+        self.tabs.addChangeListener(TabChangeListener(self))
         
         main_panel.add(self.tabs, BorderLayout.CENTER)
         
@@ -50,7 +66,7 @@ class PatternConfigDialog(JDialog):
         button_panel = JPanel(FlowLayout(FlowLayout.RIGHT))
         
         close_btn = JButton("Close")
-        close_btn.addActionListener(CloseAction(self))
+        close_btn.addActionListener(DispatchAction(self, "dispose"))
         button_panel.add(close_btn)
         
         main_panel.add(button_panel, BorderLayout.SOUTH)
@@ -74,8 +90,12 @@ class PatternConfigDialog(JDialog):
         
         gbc.gridx = 1
         gbc.weightx = 1.0
-        self.category_combo = JComboBox(["endpoints", "urls", "secrets"])
-        self.category_combo.addActionListener(CategoryChangeAction(self))
+        self.category_combo = JComboBox(combo_model(["endpoints", "urls", "secrets"]))
+        # Selection changes are coalesced - at most one refresh per 50 ms burst
+        self._refresh_timer = Timer(50, DispatchAction(self, "_refresh_tables"))
+        self._refresh_timer.setRepeats(False)
+        self._category_listener = DispatchAction(self._refresh_timer, "restart")
+        self.category_combo.addActionListener(self._category_listener)
         top_panel.add(self.category_combo, gbc)
         
         # Row 2: Regex input
@@ -106,18 +126,19 @@ class PatternConfigDialog(JDialog):
         gbc.weightx = 0
         gbc.anchor = GridBagConstraints.EAST
         add_btn = JButton("Add Pattern")
-        add_btn.addActionListener(AddPatternAction(self))
+        add_btn.addActionListener(DispatchAction(self, "add_pattern"))
         top_panel.add(add_btn, gbc)
         
         panel.add(top_panel, BorderLayout.NORTH)
         
         # Table for existing patterns
-        columns = ["Name", "Regex"]
-        self.patterns_model = NonEditableTableModel(columns, 0)
+        self.patterns_model = NonEditableTableModel(PATTERN_COLUMNS, 0)
         self.patterns_table = JTable(self.patterns_model)
         self.patterns_table.setFont(Font("Monospaced", Font.PLAIN, 11))
         self.patterns_table.getColumnModel().getColumn(0).setPreferredWidth(150)
         self.patterns_table.getColumnModel().getColumn(1).setPreferredWidth(400)
+        # Keep these columns (and widths) when bulk_set replaces the data
+        self.patterns_table.setAutoCreateColumnsFromModel(False)
         
         scroll = JScrollPane(self.patterns_table)
         panel.add(scroll, BorderLayout.CENTER)
@@ -125,7 +146,7 @@ class PatternConfigDialog(JDialog):
         # Remove button
         remove_panel = JPanel(FlowLayout(FlowLayout.LEFT))
         remove_btn = JButton("Remove Selected")
-        remove_btn.addActionListener(RemovePatternAction(self))
+        remove_btn.addActionListener(DispatchAction(self, "remove_pattern"))
         remove_panel.add(remove_btn)
         panel.add(remove_panel, BorderLayout.SOUTH)
         
@@ -146,15 +167,15 @@ class PatternConfigDialog(JDialog):
         top_panel.add(self.cat_name_field)
         
         add_cat_btn = JButton("Add Category")
-        add_cat_btn.addActionListener(AddCategoryAction(self))
+        add_cat_btn.addActionListener(DispatchAction(self, "add_category"))
         top_panel.add(add_cat_btn)
         
         panel.add(top_panel, BorderLayout.NORTH)
         
         # Table for existing categories
-        columns = ["Key", "Display Name", "Patterns"]
-        self.categories_model = NonEditableTableModel(columns, 0)
+        self.categories_model = NonEditableTableModel(CATEGORY_COLUMNS, 0)
         self.categories_table = JTable(self.categories_model)
+        self.categories_table.setAutoCreateColumnsFromModel(False)
         
         scroll = JScrollPane(self.categories_table)
         panel.add(scroll, BorderLayout.CENTER)
@@ -177,7 +198,7 @@ class PatternConfigDialog(JDialog):
         
         passive_panel = JPanel(FlowLayout(FlowLayout.LEFT))
         passive_panel.add(JLabel("Passive Mode:"))
-        self.passive_combo = JComboBox(["Enabled", "Disabled"])
+        self.passive_combo = JComboBox(combo_model(["Enabled", "Disabled"]))
         self.passive_combo.setSelectedIndex(0 if settings.get("passive_mode", True) else 1)
         passive_panel.add(self.passive_combo)
         passive_panel.add(JLabel("(Auto-analyze responses passing through proxy)"))
@@ -188,7 +209,7 @@ class PatternConfigDialog(JDialog):
         # Scope only toggle
         scope_panel = JPanel(FlowLayout(FlowLayout.LEFT))
         scope_panel.add(JLabel("Scope Only:"))
-        self.scope_combo = JComboBox(["Disabled", "Enabled"])
+        self.scope_combo = JComboBox(combo_model(["Disabled", "Enabled"]))
         self.scope_combo.setSelectedIndex(1 if settings.get("scope_only", False) else 0)
         scope_panel.add(self.scope_combo)
         scope_panel.add(JLabel("(Only analyze targets in Burp scope)"))
@@ -225,7 +246,7 @@ class PatternConfigDialog(JDialog):
         # Save button
         save_panel = JPanel(FlowLayout(FlowLayout.LEFT))
         save_btn = JButton("Save Settings")
-        save_btn.addActionListener(SaveSettingsAction(self))
+        save_btn.addActionListener(DispatchAction(self, "save_settings"))
         save_panel.add(save_btn)
         panel.add(save_panel)
         
@@ -234,34 +255,63 @@ class PatternConfigDialog(JDialog):
         
         return panel
     
+    def _build_tab(self, index):
+        """Swap a placeholder tab for its real content on first view."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self.tabs.setComponentAt(index, builder())
+        if self.categories_model is not None:
+            self._refresh_categories_table()
+    
     def _refresh_tables(self):
         """Refresh pattern and category tables."""
-        # Refresh patterns table
-        self.patterns_model.setRowCount(0)
+        # Nothing to do if neither the config nor the selected category changed
         category = str(self.category_combo.getSelectedItem())
-        patterns = self.pattern_manager.get_custom_patterns_list(category)
-        for p in patterns:
-            self.patterns_model.addRow([p.get("name", ""), p.get("regex", "")])
-        
-        # Update category combo with custom categories
-        current = str(self.category_combo.getSelectedItem())
-        self.category_combo.removeAllItems()
-        for cat in ["endpoints", "urls", "secrets"]:
-            self.category_combo.addItem(cat)
-        for cat_key in self.pattern_manager.config.get("custom_categories", {}).keys():
-            self.category_combo.addItem(cat_key)
-        
-        # Restore selection
-        for i in range(self.category_combo.getItemCount()):
-            if str(self.category_combo.getItemAt(i)) == current:
-                self.category_combo.setSelectedIndex(i)
-                break
+        state = (self.pattern_manager.version, category)
+        if state == self._refreshed_state:
+            return
+        self._refreshed_state = state
+        custom_categories = self.pattern_manager.config.get("custom_categories", {})
+        
+        # Refresh patterns table - rows are built off the EDT
+        PatternRowsWorker(self, category, state).execute()
+        
+        # Update category combo with custom categories - one model swap when the
+        # list changed, with the listener detached so it doesn't re-enter here
+        desired = ["endpoints", "urls", "secrets"]
+        desired.extend(custom_categories.keys())
+        combo = self.category_combo
+        combo.removeActionListener(self._category_listener)
+        try:
+            items = [str(combo.getItemAt(i)) for i in range(combo.getItemCount())]
+            if items != desired:
+                selected = combo.getSelectedItem()
+                combo.setModel(combo_model(desired))
+                combo.setSelectedItem(selected)
+        finally:
+            combo.addActionListener(self._category_listener)
         
         # Refresh categories table
-        self.categories_model.setRowCount(0)
-        for key, data in self.pattern_manager.config.get("custom_categories", {}).items():
-            pattern_count = len(data.get("patterns", []))
-            self.categories_model.addRow([key, data.get("display_name", key), str(pattern_count)])
+        if self.categories_model is not None:
+            self._refresh_categories_table(custom_categories)
+    
+    def _refresh_categories_table(self, custom_categories=None):
+        """Refresh the custom categories table."""
+        if custom_categories is None:
+            custom_categories = self.pattern_manager.config.get("custom_categories", {})
+        jstring = self._jstring
+        self.categories_model.bulk_set([
+            [jstring(key), jstring(data.get("display_name", key)), str(len(data.get("patterns", [])))]
+            for key, data in custom_categories.items()
+        ])
+    
+    def _jstring(self, value):
+        """Return the cached java.lang.String for a cell value, converting it once."""
+        converted = self._jstrings.get(value)
+        if converted is None:
+            converted = self._jstrings[value] = String(value)
+        return converted
     
     def add_pattern(self):
         """Add a new pattern."""
@@ -293,8 +343,17 @@ class PatternConfigDialog(JDialog):
             JOptionPane.showMessageDialog(self, "Select a pattern to remove", "Error", JOptionPane.ERROR_MESSAGE)
             return
         
+        # The rows are filled in the background and can lag behind the config or
+        # the selected category, so find the pattern by what the row shows
         category = str(self.category_combo.getSelectedItem())
-        success, error = self.pattern_manager.remove_custom_pattern(category, row)
+        entry = (self.patterns_model.getValueAt(row, 0), self.patterns_model.getValueAt(row, 1))
+        patterns = self.pattern_manager.get_custom_patterns_list(category)
+        if entry in patterns:
+            success, error = self.pattern_manager.remove_custom_pattern(category, patterns.index(entry))
+        else:
+            success, error = False, "Pattern not found - the list has been reloaded"
+            self._refreshed_state = None
+            self._refresh_tables()
         
         if success:
             self._refresh_tables()
@@ -325,12 +384,14 @@ class PatternConfigDialog(JDialog):
     
     def save_settings(self):
         """Save settings."""
-        settings = {
+        # Start from the stored settings so keys without a widget (scan limits) are kept
+        settings = dict(self.pattern_manager.get_settings())
+        settings.update({
             "passive_mode": self.passive_combo.getSelectedIndex() == 0,
             "scope_only": self.scope_combo.getSelectedIndex() == 1,
             "collect_js": self.collect_js_checkbox.isSelected(),
             "collect_html": self.collect_html_checkbox.isSelected()
-        }
+        })
         self.pattern_manager.update_settings(settings)
         JOptionPane.showMessageDialog(self, "Settings saved", "Success", JOptionPane.INFORMATION_MESSAGE)
 
@@ -338,48 +399,69 @@ class PatternConfigDialog(JDialog):
 class NonEditableTableModel(DefaultTableModel):
     def __init__(self, columns, rows):
         DefaultTableModel.__init__(self, columns, rows)
+        self.columns = Vector(columns)
     
     def isCellEditable(self, row, column):
         return False
+    
+    def bulk_set(self, rows):
+        """Replace all rows at once - one model event instead of one per addRow."""
+        self.set_rows_vector(rows_vector(rows))
+    
+    def set_rows_vector(self, data):
+        """Replace all rows with a prebuilt Vector of row Vectors."""
+        self.setDataVector(data, self.columns)
 
 
-class CloseAction(ActionListener):
-    def __init__(self, dialog):
-        self.dialog = dialog
-    def actionPerformed(self, event):
-        self.dialog.dispose()
-
-
-class CategoryChangeAction(ActionListener):
-    def __init__(self, dialog):
-        self.dialog = dialog
-    def actionPerformed(self, event):
-        self.dialog._refresh_tables()
+def combo_model(items):
+    """Build a combo box model from a list of strings in one go."""
+    return DefaultComboBoxModel(array(items, String))
 
 
-class AddPatternAction(ActionListener):
-    def __init__(self, dialog):
-        self.dialog = dialog
-    def actionPerformed(self, event):
-        self.dialog.add_pattern()
+def rows_vector(rows):
+    """Convert a list of row lists to the Vector of Vectors DefaultTableModel takes."""
+    data = Vector(len(rows))
+    for row in rows:
+        data.add(Vector(row))
+    return data
 
 
-class RemovePatternAction(ActionListener):
-    def __init__(self, dialog):
+class PatternRowsWorker(SwingWorker):
+    """Builds the patterns table rows in the background and installs them on the EDT."""
+    
+    def __init__(self, dialog, category, state):
+        SwingWorker.__init__(self)
         self.dialog = dialog
-    def actionPerformed(self, event):
-        self.dialog.remove_pattern()
+        self.category = category
+        self.state = state
+    
+    def doInBackground(self):
+        patterns = self.dialog.pattern_manager.get_custom_patterns_list(self.category)
+        jstring = self.dialog._jstring
+        return rows_vector([(jstring(name), jstring(regex)) for name, regex in patterns])
+    
+    def done(self):
+        # A newer refresh has been started since - its rows win
+        if self.state != self.dialog._refreshed_state:
+            return
+        try:
+            self.dialog.patterns_model.set_rows_vector(self.get())
+        except ExecutionException as e:
+            # Keep the rows already shown, but say why they weren't replaced
+            self.dialog.callbacks.printError("[JSCollector] Loading patterns failed: " + str(e.getCause()))
 
 
-class AddCategoryAction(ActionListener):
+class TabChangeListener(ChangeListener):
     def __init__(self, dialog):
         self.dialog = dialog
-    def actionPerformed(self, event):
-        self.dialog.add_category()
+    def stateChanged(self, event):
+        self.dialog._build_tab(self.dialog.tabs.getSelectedIndex())
 
 
-class SaveSettingsAction(ActionListener):
-    def __init__(self, dialog):
-        self.dialog = dialog
+class DispatchAction(ActionListener):
+    """Calls the named no-argument method on target, so every button shares one proxy class."""
+    def __init__(self, target, name):
+        self.target = target
+        self.name = name
     def actionPerformed(self, event):
-        self.dialog.save_settings()
+        getattr(self.target, self.name)()
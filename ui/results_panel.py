@@ -7,18 +7,30 @@ Features: Search filter, Copy button, Source filtering, Settings access
 from javax.swing import (
     JPanel, JScrollPane, JTabbedPane, JButton, JLabel,
     JTable, JComboBox, JTextField, BorderFactory, SwingUtilities,
-    JCheckBox, JDialog, JSplitPane
+    JCheckBox, JDialog, JSplitPane, Timer, SwingWorker, DefaultComboBoxModel
 )
-from javax.swing.table import DefaultTableModel
+from javax.swing.event import ChangeListener, DocumentListener
+from javax.swing.table import AbstractTableModel
 from java.awt import BorderLayout, FlowLayout, Font, Dimension, Toolkit
 from java.awt.datatransfer import StringSelection
-from java.awt.event import ActionListener, KeyListener, KeyEvent, MouseAdapter
+from java.awt.event import ActionListener, KeyEvent, MouseAdapter
+from java.lang import IllegalStateException, String, StringBuilder
+from java.util.concurrent import ExecutionException
+from java.util.regex import Pattern, PatternSyntaxException
+from collections import OrderedDict, namedtuple
+from jarray import array
 import json
 
+# A stored finding. value and source come first, in table column order;
+# value_lc is the value lowercased once for the search filter.
+Finding = namedtuple("Finding", "value source value_lc message_info")
+
 
 class ResultsPanel(JPanel):
     """Results panel with search filter and copy functionality."""
     
+    FILTER_CACHE_SIZE = 16  # filter states whose results are kept for repeat filtering
+    
     def __init__(self, callbacks, extender):
         JPanel.__init__(self)
         self.callbacks = callbacks
@@ -36,6 +48,27 @@ class ResultsPanel(JPanel):
         # Unique sources
         self.sources = set()
         
+        # Filter pass currently running in the background, if any
+        self._pending_worker = None
+        
+        # Settings snapshot the mode label and scope checkbox were last synced from
+        self._settings_shown = None
+        
+        # Filter control values, cached by their listeners so refreshes don't query Swing
+        self._selected_source = "All"
+        self._search_text = ""
+        self._use_regex = False
+        
+        # Rows passing the filters per category, for the tab titles
+        self._visible_counts = {}
+        
+        # Categories whose table is behind the filters, rebuilt when their tab is shown
+        self._dirty = {}
+        
+        # Filtered findings per (source, search, regex) filter state, least recently used first
+        self._filter_cache = OrderedDict()  # filter state -> {category: (findings version, matched)}
+        self._findings_versions = {}
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -69,14 +102,25 @@ class ResultsPanel(JPanel):
         # Search box
         controls.add(JLabel("Search:"))
         self.search_field = JTextField(15)
-        self.search_field.addKeyListener(SearchKeyListener(self))
+        # Refresh once typing pauses rather than on every keystroke
+        self._search_timer = Timer(200, RefreshAction(self))
+        self._search_timer.setRepeats(False)
+        # Watch the document so pastes, drops and setText are picked up as well
+        self.search_field.getDocument().addDocumentListener(SearchDocumentListener(self))
         controls.add(self.search_field)
         
+        # Treat the search text as a case-insensitive regex
+        self.regex_checkbox = JCheckBox("Regex")
+        self.regex_checkbox.setFont(Font("SansSerif", Font.PLAIN, 11))
+        self.regex_checkbox.addActionListener(FilterAction(self))
+        controls.add(self.regex_checkbox)
+        
         # Source filter
         controls.add(JLabel("Source:"))
         self.source_filter = JComboBox(["All"])
         self.source_filter.setPreferredSize(Dimension(150, 25))
-        self.source_filter.addActionListener(FilterAction(self))
+        self._source_listener = FilterAction(self)
+        self.source_filter.addActionListener(self._source_listener)
         controls.add(self.source_filter)
         
         # Copy button
@@ -109,7 +153,6 @@ class ResultsPanel(JPanel):
         settings_btn = JButton("Settings")
         settings_btn.addActionListener(SettingsAction(self))
         controls.add(settings_btn)
-        controls.add(settings_btn)
         
         header.add(controls, BorderLayout.EAST)
         self.add(header, BorderLayout.NORTH)
@@ -131,6 +174,7 @@ class ResultsPanel(JPanel):
         
         for title, key in self.categories:
             self._add_category_tab(title, key)
+        self.tabs.addChangeListener(TabChangeListener(self))
         
         self.add(self.tabs, BorderLayout.CENTER)
     
@@ -139,8 +183,7 @@ class ResultsPanel(JPanel):
         panel = JPanel(BorderLayout())
         
         # 2 columns: Value, Source
-        columns = ["Value", "Source"]
-        model = NonEditableTableModel(columns, 0)
+        model = FindingsTableModel()
         self.models[key] = model
         
         table = JTable(model)
@@ -160,6 +203,8 @@ class ResultsPanel(JPanel):
         panel.add(scroll, BorderLayout.CENTER)
         
         self.tabs.addTab(title + " (0)", panel)
+        self._visible_counts[key] = 0
+        self._dirty[key] = False
         
         # Initialize findings storage
         if key not in self.findings:
@@ -167,10 +212,46 @@ class ResultsPanel(JPanel):
     
     def add_findings(self, new_findings, source_name):
         """Add new findings."""
-        if source_name and source_name not in self.sources:
+        self.add_findings_batch([(source_name, new_findings)])
+    
+    def add_findings_batch(self, batch):
+        """Add a batch of (source_name, findings) pairs with a single table update."""
+        added = {}
+        removed = {}
+        overrun = False
+        source_count = len(self.sources)
+        for source_name, new_findings in batch:
+            if self._ingest_findings(new_findings, source_name, added, removed):
+                overrun = True
+        
+        if len(self.sources) != source_count:
+            self._update_source_filter()
+        
+        # Cached results of a trimmed category may still hold the dropped findings and their messages
+        if removed:
+            for cached in self._filter_cache.values():
+                for key in removed:
+                    cached.pop(key, None)
+        
+        # A filter pass that hasn't seen these yet, or new findings dropped again, need a rebuild
+        if overrun or self._pending_worker is not None:
+            self._refresh_tables()
+        else:
+            self._apply_incremental(added, removed)
+    
+    def _ingest_findings(self, new_findings, source_name, added, removed):
+        """Store new findings without refreshing the tables.
+        
+        The stored items are collected per category into added, and the old
+        ones dropped to stay within the cap into removed. Returns True if some
+        of the new items were dropped again right away.
+        """
+        overrun = False
+        if source_name:
             self.sources.add(source_name)
-            self.source_filter.addItem(source_name)
         
+        max_findings = self.extender.get_max_findings()
+        trim_to = self.extender.get_findings_trim_size()
         for finding in new_findings:
             category = finding.get("category", "")
             
@@ -180,48 +261,143 @@ class ResultsPanel(JPanel):
                 self._add_category_tab(category.title(), category)
                 self.categories.append((category.title(), category))
             
-            self.findings[category].append({
-                "value": finding.get("value", ""),
-                "source": finding.get("source", source_name),
-                "message_info": finding.get("message_info"),
-            })
-        
-        self._refresh_tables()
+            value = finding.get("value", "")
+            item = Finding(
+                value,
+                finding.get("source", source_name),
+                value.lower(),
+                finding.get("message_info"),
+            )
+            items = self.findings[category]
+            items.append(item)
+            new_items = added.setdefault(category, [])
+            new_items.append(item)
+            self._findings_versions[category] = self._findings_versions.get(category, 0) + 1
+            
+            # Same cap and trim size as the extender's seen values, so evicted values
+            # can be found again; trimming below the cap keeps it rare
+            if len(items) > max_findings:
+                cut = len(items) - trim_to
+                if cut > len(items) - len(new_items):
+                    overrun = True
+                removed.setdefault(category, []).extend(items[:cut])
+                del items[:cut]
+        return overrun
     
-    def _refresh_tables(self):
-        """Refresh tables with current filters."""
-        selected_source = str(self.source_filter.getSelectedItem())
-        search_text = self.search_field.getText().lower().strip()
+    def _update_source_filter(self):
+        """Swap in a source filter model listing all sources, keeping the selection."""
+        combo = self.source_filter
+        selected = combo.getSelectedItem()
+        combo.removeActionListener(self._source_listener)
+        try:
+            combo.setModel(DefaultComboBoxModel(array(["All"] + sorted(self.sources), String)))
+            combo.setSelectedItem(selected)
+            self._selected_source = str(combo.getSelectedItem())
+        finally:
+            combo.addActionListener(self._source_listener)
+    
+    def _apply_incremental(self, added, removed):
+        """Drop the trimmed items and append just the new ones that pass the current filters."""
+        selected_source, search_text, use_regex = self._current_filters()
+        search = search_predicate(search_text, use_regex)
         
         for i, (title, key) in enumerate(self.categories):
-            if key not in self.models:
+            old_items = removed.get(key)
+            new_items = added.get(key)
+            if not old_items and not new_items:
                 continue
+            count = self._visible_counts[key]
             
-            model = self.models[key]
-            model.setRowCount(0)
-            
-            count = 0
-            for item in self.findings.get(key, []):
-                # Source filter
-                if selected_source != "All" and item.get("source") != selected_source:
-                    continue
-                
-                # Search filter
-                if search_text:
-                    value_lower = item.get("value", "").lower()
-                    if search_text not in value_lower:
-                        continue
-                
-                model.addRow([
-                    item.get("value", ""),
-                    item.get("source", ""),
-                ])
-                count += 1
+            # Tables of hidden, out-of-date tabs are rebuilt when shown - just count
+            if old_items:
+                # The dropped findings are the oldest, so they are the first rows
+                dropped = len(filter_items(old_items, selected_source, search))
+                if dropped and not self._dirty[key]:
+                    self.models[key].remove_first(dropped)
+                count -= dropped
+            if new_items:
+                matched = filter_items(new_items, selected_source, search)
+                if matched and not self._dirty[key]:
+                    self.models[key].add_items(matched)
+                count += len(matched)
             
+            self._visible_counts[key] = count
             self.tabs.setTitleAt(i, "%s (%d)" % (title, count))
         
         self._update_stats()
     
+    def _current_filters(self):
+        """Get the (selected source, search text, regex mode) filters to apply.
+        
+        Plain search text is lowercased; regex text is kept as typed.
+        """
+        selected_source = self._selected_source
+        use_regex = self._use_regex
+        search_text = self._search_text.strip()
+        if len(search_text) < self.extender.get_search_min_length():
+            search_text = ""
+        if not use_regex:
+            search_text = search_text.lower()
+        return selected_source, search_text, use_regex
+    
+    def _read_filter_controls(self):
+        """Cache the source filter and regex toggle after one of them changed."""
+        self._selected_source = str(self.source_filter.getSelectedItem())
+        self._use_regex = self.regex_checkbox.isSelected()
+    
+    def _refresh_tables(self):
+        """Refresh tables with current filters.
+        
+        The filtering runs on a background worker over snapshots of the findings
+        lists; the rows are installed on the EDT when it finishes. Only the
+        visible tab's table is rebuilt, the other tabs just get their counts.
+        """
+        filter_state = self._current_filters()
+        cached = self._filter_cache.get(filter_state, {})
+        
+        snapshot = []
+        for i, (title, key) in enumerate(self.categories):
+            if key not in self.models:
+                continue
+            version = self._findings_versions.get(key, 0)
+            entry = cached.get(key)
+            if entry is not None and entry[0] == version:
+                snapshot.append((i, title, key, entry[1], version, True))
+            else:
+                snapshot.append((i, title, key, list(self.findings.get(key, [])), version, False))
+        
+        # Only the newest filter pass gets to install its rows
+        if self._pending_worker is not None:
+            self._pending_worker.cancel(True)
+        self._pending_worker = RefreshWorker(self, snapshot, filter_state)
+        self._pending_worker.execute()
+    
+    def _install_rows(self, filter_state, results):
+        """Show filtered findings in the visible table, count the rest (runs on the EDT)."""
+        cache = self._filter_cache
+        # (Re)insert as most recently used
+        cached = cache.pop(filter_state, {})
+        cache[filter_state] = cached
+        
+        visible_key = self._get_current_key()
+        for i, title, key, version, matched in results:
+            if key == visible_key:
+                self.models[key].set_items(matched)
+            self._dirty[key] = key != visible_key
+            self._visible_counts[key] = len(matched)
+            self.tabs.setTitleAt(i, "%s (%d)" % (title, len(matched)))
+            cached[key] = (version, matched)
+        while len(cache) > self.FILTER_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        self._update_stats()
+    
+    def _tab_changed(self):
+        """Bring the newly shown tab's table up to date if it fell behind."""
+        key = self._get_current_key()
+        if key is not None and self._dirty.get(key):
+            self._refresh_tables()
+    
     def _update_stats(self):
         """Update stats label."""
         e = len(self.findings.get("endpoints", []))
@@ -231,18 +407,18 @@ class ResultsPanel(JPanel):
         f = len(self.findings.get("files", []))
         self.stats_label.setText("| E:%d | U:%d | S:%d | M:%d | F:%d" % (e, u, s, m, f))
         
-        # Update passive mode indicator and scope checkbox
-        try:
-            settings = self.extender.get_pattern_manager().get_settings()
-            if settings.get("passive_mode", True):
-                self.mode_label.setText("[Passive]")
-            else:
-                self.mode_label.setText("[Manual]")
-            
-            # Sync scope checkbox with settings
-            self.scope_checkbox.setSelected(settings.get("scope_only", False))
-        except:
-            pass
+        # Update passive mode indicator and scope checkbox, only after settings changed
+        settings = self.extender.get_settings_snapshot()
+        if settings is self._settings_shown:
+            return
+        self._settings_shown = settings
+        if settings.get("passive_mode", True):
+            self.mode_label.setText("[Passive]")
+        else:
+            self.mode_label.setText("[Manual]")
+        
+        # Sync scope checkbox with settings
+        self.scope_checkbox.setSelected(settings.get("scope_only", False))
     
     def _get_current_table(self):
         """Get the currently visible table."""
@@ -277,31 +453,36 @@ class ResultsPanel(JPanel):
         if not table:
             return
         
-        model = table.getModel()
-        values = []
-        for i in range(model.getRowCount()):
-            values.append(str(model.getValueAt(i, 0)))
+        # Straight from the model's findings into one Java buffer
+        items = table.getModel().items
+        if not items:
+            return
         
-        if values:
-            self._copy_to_clipboard("\n".join(values))
+        text = StringBuilder(len(items) * 64)
+        for item in items:
+            text.append(item.value).append("\n")
+        text.setLength(text.length() - 1)
+        self._copy_to_clipboard(text.toString())
     
     def _copy_to_clipboard(self, text):
         """Copy text to system clipboard."""
         try:
             clipboard = Toolkit.getDefaultToolkit().getSystemClipboard()
             clipboard.setContents(StringSelection(text), None)
-        except:
-            pass
+        except IllegalStateException as e:
+            # Another application holds the clipboard
+            self.callbacks.printError("[JSCollector] Could not copy to clipboard: " + str(e))
     
     def clear_all(self):
         """Clear all results."""
         for key in self.findings:
             self.findings[key] = []
         self.sources = set()
+        self._filter_cache.clear()
         
-        self.source_filter.removeAllItems()
-        self.source_filter.addItem("All")
+        self._update_source_filter()
         self.search_field.setText("")
+        self._search_timer.stop()
         
         self.extender.clear_results()
         self._refresh_tables()
@@ -317,13 +498,9 @@ class ResultsPanel(JPanel):
         if chooser.showSaveDialog(self) == JFileChooser.APPROVE_OPTION:
             path = chooser.getSelectedFile().getAbsolutePath()
             
-            export = {}
-            for key in self.findings:
-                export[key] = [f["value"] for f in self.findings.get(key, [])]
-            
-            fp = open(path, 'w')
+            fp = open(path, 'w', 65536)
             try:
-                json.dump(export, fp, indent=2)
+                write_export(fp, self.findings)
             finally:
                 fp.close()
     
@@ -333,10 +510,11 @@ class ResultsPanel(JPanel):
         
         try:
             pattern_manager = self.extender.get_pattern_manager()
-            dialog = PatternConfigDialog(SwingUtilities.getWindowAncestor(self), pattern_manager)
+            dialog = PatternConfigDialog(SwingUtilities.getWindowAncestor(self), pattern_manager, self.callbacks)
             dialog.setVisible(True)
             
-            # Refresh mode label after settings change
+            # Pick up edited settings/patterns, then refresh mode label
+            self.extender.invalidate_cache()
             self._update_stats()
         except Exception as e:
             from javax.swing import JOptionPane
@@ -349,6 +527,7 @@ class ResultsPanel(JPanel):
             settings = pattern_manager.get_settings()
             settings["scope_only"] = self.scope_checkbox.isSelected()
             pattern_manager.update_settings(settings)
+            self.extender.invalidate_cache()
         except Exception as e:
             from javax.swing import JOptionPane
             JOptionPane.showMessageDialog(self, "Error updating settings: " + str(e), "Error", JOptionPane.ERROR_MESSAGE)
@@ -356,12 +535,12 @@ class ResultsPanel(JPanel):
     def show_request_response(self, category_key, row_index):
         """Show Request/Response popup for a finding."""
         try:
-            findings_list = self.findings.get(category_key, [])
-            if row_index < 0 or row_index >= len(findings_list):
+            model = self.models.get(category_key)
+            if model is None or row_index < 0 or row_index >= model.getRowCount():
                 return
             
-            finding = findings_list[row_index]
-            message_info = finding.get("message_info")
+            finding = model.get_item(row_index)
+            message_info = finding.message_info
             
             if not message_info:
                 from javax.swing import JOptionPane
@@ -373,7 +552,7 @@ class ResultsPanel(JPanel):
                 SwingUtilities.getWindowAncestor(self),
                 self.callbacks,
                 message_info,
-                finding.get("source", "Unknown")
+                finding.source or "Unknown"
             )
             dialog.setVisible(True)
         except Exception as e:
@@ -381,30 +560,172 @@ class ResultsPanel(JPanel):
             JOptionPane.showMessageDialog(self, "Error showing request/response: " + str(e), "Error", JOptionPane.ERROR_MESSAGE)
 
 
-class NonEditableTableModel(DefaultTableModel):
-    def __init__(self, columns, rows):
-        DefaultTableModel.__init__(self, columns, rows)
+def write_export(fp, findings):
+    """Stream {category: [values]} as JSON to fp, one value at a time.
+    
+    Only the string escaping goes through json; nothing is collected in memory first.
+    """
+    dumps = json.dumps
+    fp.write("{")
+    for n, (key, items) in enumerate(findings.items()):
+        fp.write(",\n  " if n else "\n  ")
+        fp.write(dumps(key))
+        if not items:
+            fp.write(": []")
+            continue
+        fp.write(": [")
+        sep = "\n    "
+        for item in items:
+            fp.write(sep)
+            fp.write(dumps(item.value))
+            sep = ",\n    "
+        fp.write("\n  ]")
+    fp.write("\n}\n" if findings else "}\n")
+
+
+class FindingsTableModel(AbstractTableModel):
+    """Read-only Value/Source table over a list of stored findings, without copying them into rows."""
     
-    def isCellEditable(self, row, column):
-        return False
+    COLUMNS = ("Value", "Source")  # the first fields of Finding
+    
+    def __init__(self):
+        AbstractTableModel.__init__(self)
+        self.items = []
+    
+    def getRowCount(self):
+        return len(self.items)
+    
+    def getColumnCount(self):
+        return len(self.COLUMNS)
+    
+    def getColumnName(self, column):
+        return self.COLUMNS[column]
+    
+    def getValueAt(self, row, column):
+        return self.items[row][column]
+    
+    def get_item(self, row):
+        """Get the stored finding shown at a model row."""
+        return self.items[row]
+    
+    def set_items(self, items):
+        """Show a new list of findings - one data-changed event, so widths and sorting survive."""
+        self.items = list(items)  # our own copy, the caller's list may be cached
+        self.fireTableDataChanged()
+    
+    def add_items(self, items):
+        """Append findings to the end of the table - one rows-inserted event for all of them."""
+        first = len(self.items)
+        self.items.extend(items)
+        self.fireTableRowsInserted(first, len(self.items) - 1)
+    
+    def remove_first(self, count):
+        """Drop the first count findings from the table - one rows-deleted event for all of them."""
+        del self.items[:count]
+        self.fireTableRowsDeleted(0, count - 1)
 
 
-class SearchKeyListener(KeyListener):
-    """Filters on each keystroke."""
+def search_predicate(search_text, use_regex):
+    """Build the search filter as a function of a stored finding, or None for no filter.
+    
+    Regex mode compiles one case-insensitive java.util.regex Pattern and reuses a
+    single Matcher, so the result must stay on one thread. Invalid regex text
+    falls back to a plain substring search.
+    """
+    if not search_text:
+        return None
+    if use_regex:
+        try:
+            matcher = Pattern.compile(search_text, Pattern.CASE_INSENSITIVE).matcher("")
+            return lambda item: matcher.reset(item.value).find()
+        except PatternSyntaxException:
+            search_text = search_text.lower()
+    return lambda item: search_text in item.value_lc
+
+
+def filter_items(items, selected_source, search):
+    """Return the stored findings that pass the filters, specialized on which filters are set."""
+    if selected_source == "All":
+        if search is None:
+            return items  # the default view - nothing to test
+        return [item for item in items if search(item)]
+    if search is None:
+        return [item for item in items if item.source == selected_source]
+    return [item for item in items if item.source == selected_source and search(item)]
+
+
+class RefreshWorker(SwingWorker):
+    """Filters findings snapshots in the background and installs the results on the EDT."""
+    
+    def __init__(self, panel, snapshot, filter_state):
+        SwingWorker.__init__(self)
+        self.panel = panel
+        self.snapshot = snapshot
+        self.filter_state = filter_state
+    
+    def doInBackground(self):
+        selected_source, search_text, use_regex = self.filter_state
+        search = search_predicate(search_text, use_regex)
+        results = []
+        for i, title, key, items, version, filtered in self.snapshot:
+            if self.isCancelled():
+                return None
+            
+            # Cached results are already filtered
+            if filtered:
+                matched = items
+            else:
+                matched = filter_items(items, selected_source, search)
+            results.append((i, title, key, version, matched))
+        return results
+    
+    def done(self):
+        # A newer refresh has been started since - its rows win
+        if self.isCancelled() or self is not self.panel._pending_worker:
+            return
+        self.panel._pending_worker = None
+        try:
+            self.panel._install_rows(self.filter_state, self.get())
+        except ExecutionException as e:
+            # Keep the rows already shown, but say why they weren't replaced
+            self.panel.callbacks.printError("[JSCollector] Filtering results failed: " + str(e.getCause()))
+
+
+class TabChangeListener(ChangeListener):
     def __init__(self, panel):
         self.panel = panel
-    def keyPressed(self, event):
+    def stateChanged(self, event):
+        self.panel._tab_changed()
+
+
+class SearchDocumentListener(DocumentListener):
+    """Filters once edits to the search text pause."""
+    def __init__(self, panel):
+        self.panel = panel
+    def _search_changed(self):
+        self.panel._search_text = self.panel.search_field.getText()
+        self.panel._search_timer.restart()
+    def insertUpdate(self, event):
+        self._search_changed()
+    def removeUpdate(self, event):
+        self._search_changed()
+    def changedUpdate(self, event):
         pass
-    def keyReleased(self, event):
+
+
+class RefreshAction(ActionListener):
+    """Debounced search refresh, fired by the search timer."""
+    def __init__(self, panel):
+        self.panel = panel
+    def actionPerformed(self, event):
         self.panel._refresh_tables()
-    def keyTyped(self, event):
-        pass
 
 
 class FilterAction(ActionListener):
     def __init__(self, panel):
         self.panel = panel
     def actionPerformed(self, event):
+        self.panel._read_filter_controls()
         self.panel._refresh_tables()
 
 
@@ -486,24 +807,15 @@ class RequestResponseDialog(JDialog):
         """Build the UI with Request/Response tabs."""
         main_panel = JPanel(BorderLayout())
         
-        # Create tabbed pane
-        tabs = JTabbedPane()
-        
-        # Request tab
-        request_editor = self.callbacks.createMessageEditor(None, False)
-        request = self.message_info.getRequest()
-        if request:
-            request_editor.setMessage(request, True)
-        tabs.addTab("Request", request_editor.getComponent())
-        
-        # Response tab
-        response_editor = self.callbacks.createMessageEditor(None, False)
-        response = self.message_info.getResponse()
-        if response:
-            response_editor.setMessage(response, False)
-        tabs.addTab("Response", response_editor.getComponent())
+        # Create tabbed pane - each editor is created when its tab is first shown
+        self.tabs = JTabbedPane()
+        self.tabs.addTab("Request", JPanel())
+        self.tabs.addTab("Response", JPanel())
+        self._editors = {}
+        self._build_editor(0)
+        self.tabs.addChangeListener(EditorTabListener(self))
         
-        main_panel.add(tabs, BorderLayout.CENTER)
+        main_panel.add(self.tabs, BorderLayout.CENTER)
         
         # Close button
         button_panel = JPanel(FlowLayout(FlowLayout.RIGHT))
@@ -513,6 +825,28 @@ class RequestResponseDialog(JDialog):
         main_panel.add(button_panel, BorderLayout.SOUTH)
         
         self.getContentPane().add(main_panel)
+    
+    def _build_editor(self, index):
+        """Create the message editor for a tab (0 = request, 1 = response) on first view."""
+        if index < 0 or index in self._editors:
+            return
+        is_request = index == 0
+        editor = self.callbacks.createMessageEditor(None, False)
+        if is_request:
+            message = self.message_info.getRequest()
+        else:
+            message = self.message_info.getResponse()
+        if message:
+            editor.setMessage(message, is_request)
+        self._editors[index] = editor
+        self.tabs.setComponentAt(index, editor.getComponent())
+
+
+class EditorTabListener(ChangeListener):
+    def __init__(self, dialog):
+        self.dialog = dialog
+    def stateChanged(self, event):
+        self.dialog._build_editor(self.dialog.tabs.getSelectedIndex())
 
 
 class DialogCloseAction(ActionListener):